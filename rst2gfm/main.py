@@ -1,21 +1,90 @@
 """rst2gfm - restructured text to github flavored markdown"""
 
 import argparse
+import functools
 import sys
 import re
+from typing import Iterable, Iterator, Optional, TextIO
 from docutils.core import publish_parts
 from docutils.writers import Writer
 from docutils.nodes import NodeVisitor, SkipNode
 
+# docutils ids are already ASCII, so ASCII-only \w is sufficient here
+_ANCHOR_RE = re.compile(r"[^\w\-]", re.ASCII)
+_REF_ROLE_RE = re.compile(r":ref:`([^`]+)`")
+_LEADING_WS_RE = re.compile(r"^(\s+)")
+# characters kept by _ANCHOR_RE once the anchor has been lowercased
+_ANCHOR_CHARS = frozenset("abcdefghijklmnopqrstuvwxyz0123456789_-")
+# heading prefixes indexed by section level
+_HEADINGS = tuple("#" * (level + 1) + " " for level in range(9))
+# list item prefixes indexed by nesting depth (list_depth - 1)
+_BULLET_PREFIXES = tuple("\n" + "  " * depth + "- " for depth in range(32))
+_ENUM_PREFIXES = tuple("\n" + "  " * depth + "1. " for depth in range(32))
+
+
+@functools.lru_cache(maxsize=4096)
+def _normalize_refname(refname):
+    """Normalize reference name for use in markdown reference-style links."""
+    # lower() + replace() are both C fast paths for ASCII and measure several
+    # times faster than a single str.translate() with a mapping table
+    return refname.lower().replace(" ", "-")
+
+
+@functools.lru_cache(maxsize=4096)
+def _make_anchor(ref_id):
+    """Convert RST reference ID to GitHub-compatible anchor."""
+    # GitHub lowercases anchors and replaces spaces with hyphens
+    anchor = _normalize_refname(ref_id)
+    # docutils ids are usually clean already, skip the regex for those
+    if _ANCHOR_CHARS.issuperset(anchor):
+        return anchor
+    # Remove special characters
+    return _ANCHOR_RE.sub("", anchor)
+
 
 class MarkdownTranslator(NodeVisitor):
     """Translates reStructuredText nodes to GitHub Flavored Markdown."""
     # pylint: disable=unused-argument
     # pylint: disable=missing-docstring disable=invalid-name
 
+    # NodeVisitor itself is not slotted, so ``document`` still lives in __dict__
+    __slots__ = (
+        "output",
+        "_append",
+        "_append_text",
+        "list_depth",
+        "section_level",
+        "in_code_block",
+        "in_line_block",
+        "code_language",
+        "in_table",
+        "table_data",
+        "table_has_header",
+        "table_caption",
+        "table_type",
+        "current_row",
+        "entry_text",
+        "list_type",
+        "reference_stack",
+        "pending_refs",
+        "refs_map",
+        "skip_children",
+        "spans",
+        "current_cell_colspan",
+        "current_cell_rowspan",
+        "in_footnote",
+        "footnote_label_seen",
+        "math_content",
+        "math_start",
+    )
+
     def __init__(self, document):
         super().__init__(document)
         self.output = []
+        # bound once; self.output must only be mutated in place from here on
+        self._append = self.output.append
+        # where visit_Text sends text; swapped to the cell buffer inside entries
+        self._append_text = self._append
         self.list_depth = 0
         self.section_level = 0
         self.in_code_block = False
@@ -24,7 +93,7 @@ class MarkdownTranslator(NodeVisitor):
         self.in_table = False
         self.table_data = []
         self.table_has_header = True
-        self.table_caption = ""
+        self.table_caption = None
         self.table_type = "simple"
         self.current_row = []
         self.entry_text = []
@@ -41,21 +110,45 @@ class MarkdownTranslator(NodeVisitor):
         self.math_content = ""
         self.math_start = 0
 
-    def _make_anchor(self, ref_id):
-        """Convert RST reference ID to GitHub-compatible anchor."""
-        # GitHub lowercases anchors and replaces spaces with hyphens
-        anchor = ref_id.lower().replace(" ", "-")
-        # Remove special characters
-        anchor = re.sub(r"[^\w\-]", "", anchor)
-        return anchor
-
-    def _normalize_refname(self, refname):
-        """Normalize reference name for use in markdown reference-style links."""
-        return refname.lower().replace(" ", "-")
-
     def astext(self):
         return "".join(self.output)
 
+    def write_to(self, fp):
+        """Write the output fragments to ``fp`` without joining them first."""
+        fp.writelines(self.output)
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls._build_dispatch_tables()
+
+    @classmethod
+    def _build_dispatch_tables(cls):
+        """Map node class names to this class's visit_/depart_ functions."""
+        cls._visit_table = {
+            name[len("visit_") :]: getattr(cls, name)
+            for name in dir(cls)
+            if name.startswith("visit_")
+        }
+        cls._depart_table = {
+            name[len("depart_") :]: getattr(cls, name)
+            for name in dir(cls)
+            if name.startswith("depart_")
+        }
+
+    def dispatch_visit(self, node):
+        """Call the visit_ method for ``node`` via a single dict lookup."""
+        method = self._visit_table.get(node.__class__.__name__)
+        if method is None:
+            return self.unknown_visit(node)
+        return method(self, node)
+
+    def dispatch_departure(self, node):
+        """Call the depart_ method for ``node`` via a single dict lookup."""
+        method = self._depart_table.get(node.__class__.__name__)
+        if method is None:
+            return self.unknown_departure(node)
+        return method(self, node)
+
     def default_visit(self, node):
         """Default visit method for all nodes."""
 
@@ -73,7 +166,7 @@ class MarkdownTranslator(NodeVisitor):
 
             # Extract language
             language = ""
-            if len(node.arguments) > 0:
+            if node.arguments:
                 language = node.arguments[0]
 
             # Handle options
@@ -82,15 +175,15 @@ class MarkdownTranslator(NodeVisitor):
 
             # Add comment for options that GFM doesn't support natively
             if linenos or emphasize_lines:
-                self.output.append("\n# Options: ")
+                self._append("\n# Options: ")
                 if linenos:
-                    self.output.append("line numbers, ")
+                    self._append("line numbers, ")
                 if emphasize_lines:
-                    self.output.append(f"emphasize lines {emphasize_lines}")
-                self.output.append("\n")
+                    self._append(f"emphasize lines {emphasize_lines}")
+                self._append("\n")
 
             # Start code block
-            self.output.append(f"\n```{language}")
+            self._append(f"\n```{language}")
 
     def depart_directive(self, node):
         """depart directive"""
@@ -99,7 +192,7 @@ class MarkdownTranslator(NodeVisitor):
             and "code-block" in node.attributes.get("classes", [])
         ):
             self.in_code_block = False
-            self.output.append("\n```\n\n")
+            self._append("\n```\n\n")
 
     def visit_document(self, node):
         """visit documents"""
@@ -108,10 +201,13 @@ class MarkdownTranslator(NodeVisitor):
         """depart document"""
         # Add any pending reference definitions at the end
         if self.pending_refs:
-            self.output.append("\n\n")
-            for ref_id, refname in self.pending_refs:
-                if refname in self.refs_map:
-                    self.output.append(f"[{ref_id}]: {self.refs_map[refname]}\n")
+            refs_map = self.refs_map
+            ref_lines = "".join(
+                f"[{ref_id}]: {refs_map[refname]}\n"
+                for ref_id, refname in self.pending_refs
+                if refname in refs_map
+            )
+            self._append("\n\n" + ref_lines)
 
     def visit_section(self, node):
         """visit section"""
@@ -123,12 +219,12 @@ class MarkdownTranslator(NodeVisitor):
 
     def visit_subtitle(self, node):
         """handle subtitle"""
-        self.output.append("## ")
+        self._append("## ")
         self.section_level += 1
 
     def depart_subtitle(self, node):
         """handle subtitle exit"""
-        self.output.append("\n\n")
+        self._append("\n\n")
         # TODO not sure if this section leveling is quite right
         # self.section_level -= 1
 
@@ -139,57 +235,55 @@ class MarkdownTranslator(NodeVisitor):
             self.table_caption = node.astext()
         else:
             # Regular section title
-            self.output.append(f"{'#' * (self.section_level + 1)} ")
+            if self.section_level < len(_HEADINGS):
+                self._append(_HEADINGS[self.section_level])
+            else:
+                self._append(f"{'#' * (self.section_level + 1)} ")
 
     def depart_title(self, node):
         """handle title exit"""
-        self.output.append("\n\n")
+        self._append("\n\n")
 
     def visit_paragraph(self, node):
         """handle rst paragraph"""
 
     def depart_paragraph(self, node):
         """handle rst paragraph exit"""
-        self.output.append("\n\n")
+        self._append("\n\n")
 
     def visit_Text(self, node):
         """handle rst Text"""
-        text = node.astext()
+        # Text is a str subclass; astext() only differs when it has to strip
+        # the null bytes docutils uses to mark backslash escapes
+        text = str(node)
+        if "\x00" in text:
+            text = node.astext()
 
         # Check for :ref: pattern
-        ref_pattern = r":ref:`([^`]+)`"
-        if re.search(ref_pattern, text):
+        if _REF_ROLE_RE.search(text):
             # Replace :ref:`target` with [target](#target)
-            processed_text = re.sub(ref_pattern, r"[\1](#\1)", text)
-            if self.in_table and self.entry_text is not None:
-                self.entry_text.append(processed_text)
-            else:
-                self.output.append(processed_text)
-            return
+            text = _REF_ROLE_RE.sub(r"[\1](#\1)", text)
 
-        # Regular text handling
-        if self.in_table and self.entry_text is not None:
-            self.entry_text.append(text)
-        else:
-            self.output.append(text)
+        self._append_text(text)
 
     def visit_image(self, node):
         """handle rst image"""
-        uri = node.get("uri", "")
-        alt = node.get("alt", "")
+        attrs = node.attributes
+        uri = attrs.get("uri", "")
+        alt = attrs.get("alt", "")
 
         # Extract image options
         options = []
         for option in ["width", "height", "scale", "align"]:
-            if option in node:
-                options.append(f"{option}: {node[option]}")
+            if option in attrs:
+                options.append(f"{option}: {attrs[option]}")
 
         # Add the image with alt text
-        self.output.append(f"![{alt}]({uri})")
+        self._append(f"![{alt}]({uri})")
 
         # Add options as HTML comment if present
         if options:
-            self.output.append(f" <!-- {', '.join(options)} -->")
+            self._append(f" <!-- {', '.join(options)} -->")
 
     def depart_image(self, node):
         pass
@@ -200,7 +294,7 @@ class MarkdownTranslator(NodeVisitor):
 
     def depart_line_block(self, node):
         self.in_line_block = False
-        self.output.append("\n\n")
+        self._append("\n\n")
 
     def visit_line(self, node):
         """Handle individual lines in a line block."""
@@ -212,34 +306,34 @@ class MarkdownTranslator(NodeVisitor):
             indent = " " * node.indent
         else:
             # Try to extract indentation from the text
-            match = re.match(r"^(\s+)", text)
+            match = _LEADING_WS_RE.match(text)
             if match:
                 indent = match.group(1)
 
         # Add the line with preserved indentation
-        self.output.append(f"{indent}{text}<br>\n")
+        self._append(f"{indent}{text}<br>\n")
         raise SkipNode
 
     def depart_line(self, node):
         pass
 
     def visit_emphasis(self, node):
-        self.output.append("*")
+        self._append("*")
 
     def depart_emphasis(self, node):
-        self.output.append("*")
+        self._append("*")
 
     def visit_strong(self, node):
-        self.output.append("**")
+        self._append("**")
 
     def depart_strong(self, node):
-        self.output.append("**")
+        self._append("**")
 
     def visit_literal(self, node):
-        self.output.append("`")
+        self._append("`")
 
     def depart_literal(self, node):
-        self.output.append("`")
+        self._append("`")
 
     def visit_bullet_list(self, node):
         self.list_depth += 1
@@ -247,24 +341,28 @@ class MarkdownTranslator(NodeVisitor):
 
         # Ensure proper spacing between list items
         if self.list_depth > 1 and self.output and self.output[-1] != "\n":
-            self.output.append("\n")
+            self._append("\n")
 
     def depart_bullet_list(self, node):
         self.list_depth -= 1
         self.list_type.pop()
-        self.output.append("\n")
+        self._append("\n")
 
     def visit_list_item(self, node):
-        indent = "  " * (self.list_depth - 1)
+        depth = max(self.list_depth - 1, 0)
         ## Check if we have list_type (we should)
-        if self.list_type and len(self.list_type) > 0:
-            if self.list_type[-1] == "bullet":
-                self.output.append(f"\n{indent}- ")
-            else:  # enumerated
-                self.output.append(f"\n{indent}1. ")
+        if self.list_type and self.list_type[-1] != "bullet":
+            # enumerated
+            prefixes = _ENUM_PREFIXES
+            marker = "1. "
+        else:
+            # bullet, or fallback if list_type is empty
+            prefixes = _BULLET_PREFIXES
+            marker = "- "
+        if depth < len(prefixes):
+            self._append(prefixes[depth])
         else:
-            # Fallback if list_type is empty
-            self.output.append(f"\n{indent}- ")
+            self._append(f"\n{'  ' * depth}{marker}")
 
         # Store the current position to track if we need to handle nested content
 
@@ -274,64 +372,56 @@ class MarkdownTranslator(NodeVisitor):
             content = "".join(self.output[self.list_item_start :])
             # Remove any unwanted bold markers or colons that might have been added
             content = content.replace("**", "").replace(":\n", "\n")
-            self.output = self.output[: self.list_item_start]
-            self.output.append(content)
+            del self.output[self.list_item_start :]
+            self._append(content)
             delattr(self, "list_item_start")
 
     def visit_reference(self, node):
-        self.reference_stack.append({"start": len(self.output), "text": node.astext()})
-
-        # Determine reference type
-        if "refuri" in node:
-            # External URI
-            self.output.append("[")
-        elif "refid" in node:
-            # Internal reference
-            self.output.append("[")
-        elif "refname" in node:
-            # Named reference
-            self.output.append("[")
-        else:
-            # Unknown reference type
-            self.output.append("[")
+        self.reference_stack.append(len(self.output))
+        # Every reference type opens the same way; the target is written in
+        # depart_reference
+        self._append("[")
 
     def depart_reference(self, node):
         if not self.reference_stack:
             return
 
-        ref_info = self.reference_stack.pop()
-        ref_text = ref_info["text"]
+        start = self.reference_stack.pop()
 
         # Replace content with reference text if needed
-        if len(self.output) > ref_info["start"] + 1:
+        if len(self.output) > start + 1:
             # Content was added by children, replace it
-            self.output = self.output[: ref_info["start"] + 1]
-            self.output.append(ref_text)
+            del self.output[start + 1 :]
+            self._append(node.astext())
 
-        if "refuri" in node:
+        attrs = node.attributes
+        if "refuri" in attrs:
             # External URI
-            self.output.append(f"]({node['refuri']})")
-        elif "refid" in node:
+            self._append(f"]({attrs['refuri']})")
+        elif "refid" in attrs:
             # Internal reference - convert to GFM compatible anchor
-            anchor = self._make_anchor(node["refid"])
-            self.output.append(f"](#{anchor})")
-        elif "refname" in node:
+            anchor = _make_anchor(attrs["refid"])
+            self._append(f"](#{anchor})")
+        elif "refname" in attrs:
             # Named reference - use reference-style link
-            ref_id = self._normalize_refname(node["refname"])
-            self.output.append(f"][{ref_id}]")
-            self.pending_refs.append((ref_id, node["refname"]))
+            refname = attrs["refname"]
+            ref_id = _normalize_refname(refname)
+            self._append(f"][{ref_id}]")
+            self.pending_refs.append((ref_id, refname))
         else:
-            self.output.append("]")
+            self._append("]")
 
     def visit_literal_block(self, node):
         self.in_code_block = True
+        attrs = node.attributes
+        classes = attrs.get("classes") or ()
         language = ""
         # Check for language in various attributes
-        if "language" in node:
-            language = node["language"]
-        elif "classes" in node and len(node["classes"]) > 0:
+        if "language" in attrs:
+            language = attrs["language"]
+        else:
             # RST often puts language in classes
-            for cls in node["classes"]:
+            for cls in classes:
                 if cls != "code":
                     language = cls
                     break
@@ -339,50 +429,47 @@ class MarkdownTranslator(NodeVisitor):
         # TODO docutils doesn't support linenos, highlight_args, emphasis
         # https://docutils.sourceforge.io/docs/ref/rst/directives.html#code
         options = []
-        if "linenos" in node or any(
-            "linenos" in cls for cls in node.get("classes", [])
-        ):
+        if "linenos" in attrs or any("linenos" in cls for cls in classes):
             options.append("line numbers")
-        if "highlight_args" in node and "linenostart" in node["highlight_args"]:
-            options.append(
-                f"starting from line {node['highlight_args']['linenostart']}"
-            )
-        if "highlight_args" in node and "hl_lines" in node["highlight_args"]:
-            options.append(f"highlighting lines {node['highlight_args']['hl_lines']}")
+        highlight_args = attrs.get("highlight_args") or {}
+        if "linenostart" in highlight_args:
+            options.append(f"starting from line {highlight_args['linenostart']}")
+        if "hl_lines" in highlight_args:
+            options.append(f"highlighting lines {highlight_args['hl_lines']}")
 
         # Add language specifier to code block
-        self.output.append(f"\n```{language}")
+        self._append(f"\n```{language}")
         # # Add comment for options
         if options:
-            self.output.append(f"\n# {', '.join(options)}")
+            self._append(f"\n# {', '.join(options)}")
 
     def depart_literal_block(self, node):
         self.in_code_block = False
-        self.output.append("\n```\n\n")
+        self._append("\n```\n\n")
 
     def visit_table(self, node):
         self.table_data = []
         self.in_table = True
         self.spans = []
+        self.table_caption = None
+        # Text before the first entry (the table title) is captured as the
+        # caption, so keep it out of the document body
+        self.entry_text = []
+        self._append_text = self.entry_text.append
+        classes = node.attributes.get("classes") or ()
         # Detect table type from node attributes
-        if "classes" in node:
-            if "csv-table" in node["classes"]:
-                self.table_type = "csv"
-            elif "list-table" in node["classes"]:
-                self.table_type = "list"
-            elif "grid" in node["classes"]:
-                self.table_type = "grid"
-            else:
-                self.table_type = "simple"
+        if "csv-table" in classes:
+            self.table_type = "csv"
+        elif "list-table" in classes:
+            self.table_type = "list"
+        elif "grid" in classes:
+            self.table_type = "grid"
         else:
             self.table_type = "simple"
 
         # Check if table should have a header
         # Look for classes or other indicators in the node
-        if "classes" in node and "no-header" in node["classes"]:
-            self.table_has_header = False
-        else:
-            self.table_has_header = True
+        self.table_has_header = "no-header" not in classes
 
     def depart_table(self, node):
         if not self.table_data:
@@ -400,16 +487,17 @@ class MarkdownTranslator(NodeVisitor):
 
     def _convert_to_markdown_table(self):
         # Process table data into markdown table
-        col_count = max(len(row) for row in self.table_data)
+        col_count = max(map(len, self.table_data))
+        # Index spans by (row, col) so each cell is a single lookup
+        spans = {(span["row"], span["col"]): span for span in self.spans}
 
         table_md = []
 
-        if self.table_has_header and len(self.table_data) > 0:
+        if self.table_has_header:
             # Use first row as header
             header = self.table_data[0]
             # Ensure header has enough columns
-            while len(header) < col_count:
-                header.append("")
+            header.extend([""] * (col_count - len(header)))
             table_md.append("| " + " | ".join(header) + " |")
             table_md.append("| " + " | ".join(["---"] * len(header)) + " |")
             data_rows = self.table_data[1:]
@@ -425,17 +513,10 @@ class MarkdownTranslator(NodeVisitor):
             col_idx = 0
             while col_idx < len(row):
                 # Check if this cell has a colspan
-                span = next(
-                    (
-                        s
-                        for s in self.spans
-                        if s["row"] == row_idx + 1 and s["col"] == col_idx
-                    ),
-                    None,
-                )
+                span = spans.get((row_idx + 1, col_idx))
                 if span and span["morecols"] > 0:
                     # Add the cell content
-                    row_str += row[col_idx] + " |" + "".join([""] * span["morecols"])
+                    row_str += row[col_idx] + " |"
                     col_idx += span["morecols"] + 1
                 else:
                     # Regular cell
@@ -443,24 +524,24 @@ class MarkdownTranslator(NodeVisitor):
                     col_idx += 1
             table_md.append(row_str)
 
-        if hasattr(self, "table_caption"):
+        if self.table_caption is not None:
             table_md.append(f"\n*Table: {self.table_caption}*\n")
-            delattr(self, "table_caption")
+            self.table_caption = None
 
-        self.output.append("\n" + "\n".join(table_md) + "\n\n")
+        table_body = "\n".join(table_md)
+        self._append(f"\n{table_body}\n\n")
         self.in_table = False
 
     def _convert_to_html_table(self):
         html = ["<table>"]
+        spans = {(span["row"], span["col"]): span for span in self.spans}
 
         # Add header row
         if self.table_data:
-            html.append("<thead>")
-            html.append("<tr>")
+            html.append("<thead>\n<tr>")
             for cell in self.table_data[0]:
                 html.append(f"<th>{cell}</th>")
-            html.append("</tr>")
-            html.append("</thead>")
+            html.append("</tr>\n</thead>")
 
         # Add data rows
         if len(self.table_data) > 1:
@@ -470,14 +551,7 @@ class MarkdownTranslator(NodeVisitor):
                 col_idx = 0
                 while col_idx < len(row):
                     # Check for spans
-                    span = next(
-                        (
-                            s
-                            for s in self.spans
-                            if s["row"] == row_idx + 1 and s["col"] == col_idx
-                        ),
-                        None,
-                    )
+                    span = spans.get((row_idx + 1, col_idx))
                     if span:
                         colspan = span.get("morecols", 0) + 1
                         rowspan = span.get("morerows", 0) + 1
@@ -496,7 +570,8 @@ class MarkdownTranslator(NodeVisitor):
             html.append("</tbody>")
 
         html.append("</table>")
-        self.output.append("\n" + "\n".join(html) + "\n\n")
+        html_body = "\n".join(html)
+        self._append(f"\n{html_body}\n\n")
 
     def visit_row(self, node):
         self.current_row = []
@@ -506,6 +581,7 @@ class MarkdownTranslator(NodeVisitor):
 
     def visit_entry(self, node):
         self.entry_text = []
+        self._append_text = self.entry_text.append
 
         # Track spans
         morecols = node.get("morecols", 0)
@@ -525,28 +601,32 @@ class MarkdownTranslator(NodeVisitor):
             )
 
     def depart_entry(self, node):
-        text = "".join(self.entry_text).replace("\n", "<br>").strip()
+        text = "".join(self.entry_text)
+        # Most cells are single-line, so avoid the extra copy for them
+        if "\n" in text:
+            text = text.replace("\n", "<br>")
+        text = text.strip()
 
         # Add the cell to the current row
         self.current_row.append(text)
 
         # If we have colspan, add empty cells to account for it
-        if hasattr(self, "current_cell_colspan") and self.current_cell_colspan > 1:
-            for _ in range(self.current_cell_colspan - 1):
-                self.current_row.append("")
+        if self.current_cell_colspan > 1:
+            self.current_row.extend([""] * (self.current_cell_colspan - 1))
         self.entry_text = None
+        self._append_text = self._append
 
     def visit_transition(self, node):
-        self.output.append("\n---\n\n")
+        self._append("\n---\n\n")
 
     def depart_transition(self, node):
         pass
 
     def visit_block_quote(self, node):
-        self.output.append("\n> ")
+        self._append("\n> ")
 
     def depart_block_quote(self, node):
-        self.output.append("\n\n")
+        self._append("\n\n")
 
     def visit_enumerated_list(self, node):
         self.list_depth += 1
@@ -554,14 +634,14 @@ class MarkdownTranslator(NodeVisitor):
 
     def depart_enumerated_list(self, node):
         self.list_depth -= 1
-        self.output.append("\n")
+        self._append("\n")
         self.list_type.pop()
 
     def visit_definition_list(self, node):
         pass
 
     def depart_definition_list(self, node):
-        self.output.append("\n")
+        self._append("\n")
 
     def visit_definition_list_item(self, node):
         pass
@@ -570,16 +650,16 @@ class MarkdownTranslator(NodeVisitor):
         pass
 
     def visit_term(self, node):
-        self.output.append("\n**")
+        self._append("\n**")
 
     def depart_term(self, node):
-        self.output.append("**\n")
+        self._append("**\n")
 
     def visit_definition(self, node):
-        self.output.append(": ")
+        self._append(": ")
 
     def depart_definition(self, node):
-        self.output.append("\n")
+        self._append("\n")
 
     def visit_role(self, node):
         """Handle roles like :ref:"""
@@ -588,67 +668,65 @@ class MarkdownTranslator(NodeVisitor):
             # This is a reference to an internal target
             target = node.get("target")
             # Create a Markdown link to the target
-            self.output.append(f"[{target}](#{target})")
+            self._append(f"[{target}](#{target})")
             # Skip processing children
             raise SkipNode
 
     def visit_admonition(self, node):
         """Generic handler for admonition nodes."""
-        self.output.append("\n> ")
-
         # Get admonition type from node class
         admonition_type = node.__class__.__name__
         if admonition_type.endswith("Admonition"):
             admonition_type = admonition_type[:-10]  # Remove 'Admonition' suffix
 
         # Add admonition title in bold
-        self.output.append(f"\n**{admonition_type.title()}:** ")
+        self._append(f"\n> \n**{admonition_type.title()}:** ")
 
     def depart_admonition(self, node):
-        self.output.append("\n\n")
+        self._append("\n\n")
 
     # Add specific handlers for common admonition types
     def visit_note(self, node):
-        self.output.append(f"\n> **Note:** \n> {node.astext()}")
+        self._append(f"\n> **Note:** \n> {node.astext()}")
 
     def depart_note(self, node):
-        self.output.append("\n\n")
+        self._append("\n\n")
 
     def visit_warning(self, node):
-        self.output.append(f"\n> **Warning:** \n> {node.astext()}")
+        self._append(f"\n> **Warning:** \n> {node.astext()}")
 
     def depart_warning(self, node):
-        self.output.append("\n\n")
+        self._append("\n\n")
 
     def visit_attention(self, node):
-        self.output.append(f"\n> **Attention:** \n> {node.astext()}")
+        self._append(f"\n> **Attention:** \n> {node.astext()}")
 
     def depart_attention(self, node):
-        self.output.append("\n\n")
+        self._append("\n\n")
 
     def visit_caution(self, node):
-        self.output.append("\n> **Caution:** ")
+        self._append("\n> **Caution:** ")
 
     def depart_caution(self, node):
-        self.output.append("\n\n")
+        self._append("\n\n")
 
     def visit_danger(self, node):
-        self.output.append("\n> **Danger:** ")
+        self._append("\n> **Danger:** ")
 
     def depart_danger(self, node):
-        self.output.append("\n\n")
+        self._append("\n\n")
 
     def visit_tip(self, node):
-        self.output.append("\n> **Tip:** ")
+        self._append("\n> **Tip:** ")
 
     def depart_tip(self, node):
-        self.output.append("\n\n")
+        self._append("\n\n")
 
     def visit_important(self, node):
-        self.output.append("\n> **Important:** ")
+        self._append("\n> **Important:** ")
 
     def depart_important(self, node):
-        self.output.append("\n\n")
+        self._append("\n\n")
 
     def visit_footnote_reference(self, node):
         """Handle footnote references in the text."""
@@ -660,7 +738,7 @@ class MarkdownTranslator(NodeVisitor):
             self.output[-1] = self.output[-1].rstrip()
 
         # Add the footnote reference in GFM format
-        self.output.append(f"[^{refid}]")
+        self._append(f"[^{refid}]")
 
         # Skip processing children since we've already used the text
         raise SkipNode()
@@ -677,7 +755,7 @@ class MarkdownTranslator(NodeVisitor):
                     break
 
         # Start the footnote definition
-        self.output.append(f"\n[^{footnote_id}]: ")
+        self._append(f"\n[^{footnote_id}]: ")
 
         # We'll handle the content in the children, but skip the label
         self.in_footnote = True
@@ -685,11 +763,11 @@ class MarkdownTranslator(NodeVisitor):
 
     def depart_footnote(self, node):
         self.in_footnote = False
-        self.output.append("\n\n")
+        self._append("\n\n")
 
     def visit_label(self, node):
         """Handle footnote labels."""
-        if hasattr(self, "in_footnote") and self.in_footnote:
+        if self.in_footnote:
             # Skip the label in footnote definitions
             self.footnote_label_seen = True
             raise SkipNode()
@@ -704,58 +782,59 @@ class MarkdownTranslator(NodeVisitor):
         # Mark the start position to replace content later
         self.math_start = len(self.output)
         # Add the opening delimiter
-        self.output.append("$")
+        self._append("$")
 
     def depart_math(self, node):
         # Remove any duplicate content added by children
         if hasattr(self, "math_start"):
             # Keep only up to the $ delimiter
-            self.output = self.output[: self.math_start + 1]
+            del self.output[self.math_start + 1 :]
             # Add the math content
-            self.output.append(self.math_content)
+            self._append(self.math_content)
             # Remove the attribute
             delattr(self, "math_start")
 
         # Add the closing delimiter
-        self.output.append("$")
+        self._append("$")
 
     def visit_math_block(self, node):
         """Handles block/display math expressions."""
         # GitHub uses $$ for block math
-        self.output.append("\n$$\n")
-        self.output.append(node.astext())
+        self._append(f"\n$$\n{node.astext()}")
 
     def depart_math_block(self, node):
-        self.output.append("\n$$\n")
+        self._append("\n$$\n")
 
     def visit_displaymath(self, node):
         """Handles Sphinx displaymath node."""
-        self.output.append("\n$$\n")
+        self._append("\n$$\n")
         if node.get("nowrap", False):
             # No wrapping - output as is
-            self.output.append(node["latex"])
+            self._append(node["latex"])
         else:
             # May need to handle alignment
             latex = node["latex"]
             if "\\begin{align" in latex or "\\begin{equation" in latex:
                 # Already has environment, output as is
-                self.output.append(latex)
+                self._append(latex)
             else:
                 # Wrap in equation environment
-                self.output.append(latex)
+                self._append(latex)
 
     def depart_displaymath(self, node):
-        self.output.append("\n$$\n")
+        self._append("\n$$\n")
 
     def visit_target(self, node):
-        if "refid" in node:
+        attrs = node.attributes
+        if "refid" in attrs:
             # This is an anchor target
-            anchor = self._make_anchor(node["refid"])
-            self.output.append(f'<a id="{anchor}"></a>')
-        elif "refuri" in node:
+            anchor = _make_anchor(attrs["refid"])
+            self._append(f'<a id="{anchor}"></a>')
+        elif "refuri" in attrs:
             # This is a reference definition
-            if "names" in node and node["names"]:
-                self.refs_map[node["names"][0]] = node["refuri"]
+            names = attrs.get("names")
+            if names:
+                self.refs_map[names[0]] = attrs["refuri"]
 
     def visit_interpreted(self, node):
         """Handle interpreted text roles."""
@@ -764,7 +843,7 @@ class MarkdownTranslator(NodeVisitor):
             # Extract the target from the node text
             target = node.astext()
             # Create a Markdown link to the target
-            self.output.append(f"[{target}](#{target})")
+            self._append(f"[{target}](#{target})")
             # Skip processing children
             raise SkipNode
 
@@ -779,36 +858,60 @@ class MarkdownTranslator(NodeVisitor):
 
     def unknown_visit(self, node):
         # node_type = node.__class__.__name__
-        # self.output.append(f"<!-- Unsupported RST element: {node_type} -->")
+        # self._append(f"<!-- Unsupported RST element: {node_type} -->")
         pass
 
     def unknown_departure(self, node):
         pass
 
 
+MarkdownTranslator._build_dispatch_tables()  # pylint: disable=protected-access
+
+
 class MarkdownWriter(Writer):
     """Writer for converting reStructuredText to GitHub Flavored Markdown."""
 
-    def __init__(self):
+    def __init__(self, stream: Optional[TextIO] = None):
         super().__init__()
         self.translator_class = MarkdownTranslator
+        # when set, output is streamed here instead of built up in memory
+        self.stream = stream
 
     def translate(self):
         visitor = self.translator_class(self.document)
         self.document.walkabout(visitor)
-        self.output = visitor.astext()
+        if self.stream is not None:
+            visitor.write_to(self.stream)
+            self.output = ""
+        else:
+            self.output = visitor.astext()
 
 
-def convert_rst_to_md(rst_content: str) -> str:
-    """Convert reStructuredText to GitHub Flavored Markdown."""
+def convert_rst_to_md(rst_content: str, writer: Optional[MarkdownWriter] = None) -> str:
+    """Convert reStructuredText to GitHub Flavored Markdown.
+
+    An existing ``writer`` may be passed in to reuse it across calls.
+    """
     parts = publish_parts(
         source=rst_content,
-        writer=MarkdownWriter(),
+        writer=writer if writer is not None else MarkdownWriter(),
         settings_overrides={"report_level": 5, "syntax_highlight": "short"},
     )
     return parts["whole"]
 
 
+def convert_many(rst_contents: Iterable[str]) -> Iterator[str]:
+    """Convert several reStructuredText documents, sharing a single writer."""
+    writer = MarkdownWriter()
+    for rst_content in rst_contents:
+        yield convert_rst_to_md(rst_content, writer=writer)
+
+
+def convert_rst_to_file(rst_content: str, fp: TextIO) -> None:
+    """Convert reStructuredText and write the Markdown directly to ``fp``."""
+    convert_rst_to_md(rst_content, writer=MarkdownWriter(stream=fp))
+
+
 def main():
     """Run the CLI"""
     parser = argparse.ArgumentParser(
@@ -825,15 +928,12 @@ def main():
     else:
         rst_content = sys.stdin.read()
 
-    # Convert content
-    md_content = convert_rst_to_md(rst_content)
-
-    # Write output
+    # Convert content and write output
     if args.output:
         with open(args.output, "w", encoding="utf-8") as f:
-            f.write(md_content)
+            convert_rst_to_file(rst_content, f)
     else:
-        print(md_content)
+        print(convert_rst_to_md(rst_content))
 
 
 if __name__ == "__main__":
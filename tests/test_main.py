@@ -2,7 +2,13 @@
 
 import sys
 
-from rst2gfm.main import convert_rst_to_md, main
+from rst2gfm.main import (
+    MarkdownTranslator,
+    MarkdownWriter,
+    convert_many,
+    convert_rst_to_md,
+    main,
+)
 
 
 def test_basic_conversion():
@@ -96,6 +102,7 @@ def test_tables():
     assert "| --- | --- |" in md_content
     assert "| A | B |" in md_content
     assert "| C | D |" in md_content
+    assert "*Table:" not in md_content
 
 
 def test_literal_text():
@@ -105,6 +112,14 @@ def test_literal_text():
     assert "This is `code`" in md_content
 
 
+def test_escaped_text():
+    """Test backslash escapes are resolved in plain text."""
+    rst_content = r"Not \*emphasis\* here"
+    md_content = convert_rst_to_md(rst_content)
+    assert "Not *emphasis* here" in md_content
+    assert "\x00" not in md_content
+
+
 def test_complex_document():
     """Test conversion of a more complex document."""
     rst_content = """
@@ -149,6 +164,29 @@ This is *italic* and **bold** text with ``code``.
     assert "[Link](https://example.com)" in md_content
 
 
+def test_convert_many():
+    """Test batch conversion matches converting documents one at a time."""
+    rst_contents = ["Title\n=====\n\n*one*", "- a\n- b", "`Link <https://x.org>`_"]
+    md_contents = list(convert_many(rst_contents))
+    assert md_contents == [convert_rst_to_md(rst) for rst in rst_contents]
+
+
+def test_translator_subclass_dispatch():
+    """Test visitor methods overridden in a subclass are dispatched to."""
+
+    class ShoutingTranslator(MarkdownTranslator):
+        def visit_strong(self, node):
+            self._append("__")
+
+        def depart_strong(self, node):
+            self._append("__")
+
+    writer = MarkdownWriter()
+    writer.translator_class = ShoutingTranslator
+    md_content = convert_rst_to_md("**bold** and *italic*", writer=writer)
+    assert "__bold__ and *italic*" in md_content
+
+
 def test_command_line_interface(monkeypatch, capsys, tmp_path):
     """Test the command line interface."""
     # Create a temporary input file
@@ -166,6 +204,20 @@ def test_command_line_interface(monkeypatch, capsys, tmp_path):
     assert "**Bold text**" in captured.out
 
 
+def test_command_line_output_file(monkeypatch, tmp_path):
+    """Test the command line interface writing to an output file."""
+    input_file = tmp_path / "input.rst"
+    input_file.write_text("Title\n=====\n\n**Bold text**")
+    output_file = tmp_path / "output.md"
+
+    monkeypatch.setattr(
+        sys, "argv", ["rst2gfm", str(input_file), "-o", str(output_file)]
+    )
+    main()
+
+    assert output_file.read_text() == convert_rst_to_md(input_file.read_text())
+
+
 def test_math_expressions():
     """Test conversion of math expressions."""
     rst_content = """
@@ -295,6 +347,28 @@ def test_table_with_no_header():
     assert "*Table: Table without header*" in md_content
 
 
+def test_table_titles_not_repeated():
+    """Test table titles only appear as captions, for every table."""
+    rst_content = """
+.. table:: First
+
+   ===  ===
+   a    b
+   ===  ===
+
+.. table:: Second
+
+   ===  ===
+   c    d
+   ===  ===
+"""
+    md_content = convert_rst_to_md(rst_content)
+    assert "*Table: First*" in md_content
+    assert "*Table: Second*" in md_content
+    assert md_content.count("First") == 1
+    assert md_content.count("Second") == 1
+
+
 def test_table_with_spans():
     """Test table with row and column spans."""
     rst_content = """